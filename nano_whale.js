@@ -1,5 +1,6 @@
 const path = require('path');
 const Module = require('module');
+const fs = require('fs');
 
 // Module resolution patch for compiled executable
 const isCompiled = !process.execPath.includes('bun') && (
@@ -9,16 +10,21 @@ const isCompiled = !process.execPath.includes('bun') && (
 if (isCompiled) {
   const exeDir = path.dirname(process.execPath);
   const originalResolve = Module._resolveFilename;
+  // Cache resolved paths
+  const resolvedCache = new Map();
+  const remember = (request, resolved) => (resolvedCache.set(request, resolved), resolved);
   
   Module._resolveFilename = function(request, parent, isMain) {
+    const cached = resolvedCache.get(request);
+    if (cached) return cached;
     if (request.startsWith('./widgets') || request.startsWith('./events') || request.startsWith('../events')) {
       const neoBlessed = path.join(exeDir, 'node_modules', 'neo-blessed', 'lib');
       const resolved = path.join(neoBlessed, request.replace(/^\.\.?\//, ''));
-      try { return originalResolve.call(this, resolved, parent, isMain); } catch (_) {}
+      try { return remember(request, originalResolve.call(this, resolved, parent, isMain)); } catch (_) {}
     }
     if (!request.startsWith('.') && !request.startsWith('/')) {
       try {
-        return originalResolve.call(this, path.join(exeDir, 'node_modules', request), parent, isMain);
+        return remember(request, originalResolve.call(this, path.join(exeDir, 'node_modules', request), parent, isMain));
       } catch (_) {}
     }
     return originalResolve.call(this, request, parent, isMain);
@@ -26,14 +32,40 @@ if (isCompiled) {
 }
 
 const blessed = require('neo-blessed');
-const { exec, spawn, execSync } = require("child_process");
-const util = require("util");
+const { execFile, spawn } = require("child_process");
 const os = require("os");
-const execPromise = util.promisify(exec);
+const { PassThrough } = require("stream");
 
-const isWindows = os.platform() === "win32";
+const platform = os.platform();
+const isWindows = platform === "win32";
 const dockerCmd = isWindows ? "wsl docker" : "docker";
 
+// Resolve once from PATH; bare name if missing
+function resolveExecutable(name) {
+  const exts = isWindows ? (process.env.PATHEXT || ".EXE").split(";") : [""];
+  for (const dir of (process.env.PATH || "").split(path.delimiter)) {
+    if (!dir) continue;
+    for (const ext of exts) {
+      const full = path.join(dir, name + ext);
+      try {
+        fs.accessSync(full, fs.constants.X_OK);
+        if (fs.statSync(full).isFile()) return full;
+      } catch (_) {}
+    }
+  }
+  return name;
+}
+
+const [dockerName, ...dockerArgs] = dockerCmd.split(" ");
+const dockerFile = resolveExecutable(dockerName);
+const whichCmd = isWindows ? "where" : "which";
+const STATS_ARGS = [...dockerArgs, "stats", "--no-stream=false", "--format", "{{.Name}}\t{{.CPUPerc}}\t{{.MemPerc}}\t{{.MemUsage}}\t{{.NetIO}}\t{{.BlockIO}}\t{{.PIDs}}"];
+const FOLLOW_ARGS = [...dockerArgs, "logs", "-f"];
+const LOGS_ARGS = [...FOLLOW_ARGS, "--tail"];
+const EVENTS_ARGS = [...dockerArgs, "events", "--format", "{{json .}}"];
+const EXEC_ARGS = [...dockerArgs, "exec", "-it"];
+const SHELL_ENTRY = "exec /bin/bash || exec /bin/sh";
+
 // ==================== STATE ====================
 const state = {
   containers: [],
@@ -55,16 +87,53 @@ const state = {
   selectedNetworkIndex: 0,
   currentTab: 0,
   logsContent: "",
+  logsLines: 0,
+  logsPending: [],
+  logsPendingChars: 0,
   logsAutoScroll: true,
+  logsJumpToEnd: false,
   inFullscreenMode: false,
   statsProcess: null,
-  logProcess: null,
+  statsRetryDelay: 250,
+  eventsProcess: null,
+  eventKeys: new Set(),
+  eventTimer: null,
+  lastFullRefresh: { containers: 0, misc: 0 },
+  logTail: null,
+  parkedLog: null,
+  logsContainer: null,
+  logFlushTimer: null,
+  logSwitchTimer: null,
+  detailTimer: null,
   fullscreenChild: null,
+  dockerShell: null,
+  cleanedUp: false,
   containersInterval: null,
   miscInterval: null,
 };
 
 const MAX_HISTORY = 80;
+const STATS_RETRY_MIN = 250;
+const STATS_RETRY_MAX = 8000;
+const LOG_FLUSH_MS = 50;
+// Lines replayed before following
+const LOG_TAIL_LINES = "100";
+const FULLSCREEN_TAIL_LINES = "1000";
+const LOG_MAX_CHARS = 100000;
+const LOG_KEEP_CHARS = 75000;
+const LOG_MAX_LINES = 5000;
+const LOG_KEEP_LINES = 4000;
+const LOG_SWITCH_DELAY_MS = 150;
+const LOG_PARK_MS = 60000;
+const DETAIL_SWITCH_DELAY_MS = 150;
+const PROBE_TTL_MS = 30000;
+const EVENT_REFRESH_MS = 250;
+const EVENT_RETRY_MS = 5000;
+const FULL_REFRESH_MS = 60000;
+// name, cpu%, mem%, mem usage, net I/O, block I/O, pids after the clear-screen codes
+const STATS_ROW_RE = /^(?:\x1b\[[\d;]*[A-Za-z])*([^\t]+)\t([^\t]*)\t([^\t]*)\t([^\t]*)\t([^\t]*)\t([^\t]*)\t([^\t]*)$/;
+const LEADING_NUMBER_RE = /^([\d.]+)/;
+const SYSTEM_NETWORKS = new Set(["bridge", "host", "none"]);
 const TAB_NAMES = ["Logs", "Stats", "Env", "Config", "Top"];
 
 // ==================== UI SETUP ====================
@@ -76,8 +145,17 @@ const screen = blessed.screen({
   mouse: true,
 });
 
-const originalRender = screen.render.bind(screen);
-screen.render = () => !state.inFullscreenMode && originalRender();
+// Coalesce render requests into one per tick; skip while fullscreen
+const renderNow = screen.render.bind(screen);
+let renderQueued = false;
+screen.render = () => {
+  if (renderQueued) return;
+  renderQueued = true;
+  setImmediate(() => {
+    renderQueued = false;
+    if (!state.inFullscreenMode) renderNow();
+  });
+};
 
 const ui = {
   projectBox: blessed.box({
@@ -162,152 +240,431 @@ ui.tabHeader.on('click', async (data) => {
 });
 
 // ==================== DOCKER API ====================
-async function dockerExec(cmd, timeout = 5000) {
-  try {
-    const { stdout } = await execPromise(`${dockerCmd} ${cmd}`, { timeout });
-    return stdout.trim();
-  } catch (error) {
-    return null;
+const shellPrefix = isWindows ? ["wsl", "-e", "sh", "-c"] : ["sh", "-c"];
+const BATCH_SEP = "__NW_SEP__";
+const BATCH_FAIL = "__NW_FAIL__";
+const SHELL_MAX_TIMEOUT = 10000;
+const shell = { queue: Promise.resolve(), seq: 0, broken: false };
+
+// Kill a child and its process group (taskkill /T on Windows)
+function killTree(proc) {
+  if (!proc || proc.exitCode !== null || proc.signalCode !== null) return;
+  if (isWindows) {
+    spawn("taskkill", ["/pid", String(proc.pid), "/T", "/F"], { stdio: "ignore", windowsHide: true }).on("error", () => {});
+    return;
+  }
+  try { process.kill(-proc.pid, "SIGKILL"); } catch (_) {
+    try { proc.kill("SIGKILL"); } catch (_) {}
   }
 }
 
-async function getContainers() {
-  const out = await dockerExec('ps -a --format "{{.Names}}|{{.Status}}|{{.ID}}|{{.Image}}|{{.Ports}}|{{.State}}"');
-  if (out === null) return state.containers;
-  if (!out) return [];
-  return out.split("\n").filter(Boolean).map(line => {
-    const [name, status, id, image, ports, st] = line.split("|");
-    return { name, status, id: id?.substring(0, 12) || "N/A", image, ports: ports || "", state: st || "unknown" };
+// Persistent (wsl) sh that docker commands are piped through
+function getShell() {
+  if (state.dockerShell) return state.dockerShell;
+  const [file, ...args] = shellPrefix.slice(0, -1);
+  const proc = spawn(file, args, { stdio: ["pipe", "pipe", "ignore"], detached: !isWindows });
+  proc.stdin.on("error", () => {});
+  proc.on("error", () => { shell.broken = true; if (state.dockerShell === proc) state.dockerShell = null; });
+  proc.on("exit", () => { if (state.dockerShell === proc) state.dockerShell = null; });
+  state.dockerShell = proc;
+  return proc;
+}
+
+function shellRun(script, timeout) {
+  const run = () => new Promise(resolve => {
+    const proc = getShell();
+    const tag = `__NW_END_${++shell.seq}__`;
+    const marker = Buffer.from(tag);
+    const chunks = [];
+    let tail = Buffer.alloc(0), seen = false;
+    const finish = result => {
+      clearTimeout(timer);
+      proc.stdout.off("data", onData);
+      proc.off("exit", onExit);
+      proc.off("error", onExit);
+      resolve(result);
+    };
+    // Only the chunk boundary is scanned for the marker
+    const onData = chunk => {
+      chunks.push(chunk);
+      if (!seen) {
+        seen = chunk.includes(marker) || Buffer.concat([tail, chunk.subarray(0, marker.length)]).includes(marker);
+        tail = chunk.length >= marker.length ? chunk.subarray(1 - marker.length) : Buffer.concat([tail, chunk]).subarray(1 - marker.length);
+        if (!seen) return;
+      }
+      const out = Buffer.concat(chunks);
+      const idx = out.lastIndexOf(marker);
+      const eol = out.indexOf(0x0a, idx);
+      if (eol === -1) return;
+      finish({ code: parseInt(out.toString("latin1", idx + marker.length, eol), 10), stdout: out.toString("utf8", 0, idx) });
+    };
+    const onExit = () => finish(null);
+    const timer = setTimeout(() => {
+      if (state.dockerShell === proc) state.dockerShell = null;
+      killTree(proc);
+      finish(null);
+    }, timeout);
+    proc.stdout.on("data", onData);
+    proc.on("exit", onExit);
+    proc.on("error", onExit);
+    proc.stdin.write(`{ ${script}\n} </dev/null\nprintf '\\n${tag} %d\\n' $?\n`);
   });
+  const result = shell.queue.then(run);
+  shell.queue = result;
+  return result;
+}
+
+// Long actions get their own process
+async function runScript(script, timeout) {
+  if (timeout <= SHELL_MAX_TIMEOUT && !shell.broken) return shellRun(script, timeout);
+  const [file, ...args] = shellPrefix;
+  return execCapture(file, [...args, script], timeout);
 }
 
-async function getImages() {
-  const out = await dockerExec('images --format "{{.Repository}}|{{.Tag}}|{{.Size}}|{{.ID}}"');
-  if (out === null) return state.images;
-  if (!out) return [];
-  return out.split("\n").filter(Boolean).map(line => {
-    const [repo, tag, size, id] = line.split("|");
-    return { repo, tag, size, id: id?.substring(0, 12) || "N/A" };
+// In-flight one-shot children, killed on quit
+const captures = new Set();
+
+// Resolves with the exit status instead of rejecting
+function execCapture(file, args, timeout) {
+  return new Promise(resolve => {
+    const child = execFile(file, args, { timeout, windowsHide: true }, (error, stdout, stderr) => {
+      captures.delete(child);
+      const code = !error ? 0 : typeof error.code === "number" ? error.code : -1;
+      resolve({ code, stdout, stderr });
+    });
+    captures.add(child);
+    // Nothing is ever written to stdin
+    child.stdin.end();
   });
 }
 
-async function getVolumes() {
-  const out = await dockerExec('volume ls --format "{{.Driver}}|{{.Name}}"');
-  if (out === null) return state.volumes;
-  if (!out) return [];
-  return out.split("\n").filter(Boolean).map(line => {
-    const [driver, name] = line.split("|");
-    return { driver: driver || "local", name: name || "N/A" };
+const dockerRun = (args, timeout) => execCapture(dockerFile, [...dockerArgs, ...args], timeout);
+const failure = res => res.stderr.trim() || `exit code ${res.code}`;
+
+async function dockerExec(cmd, timeout = 5000) {
+  const res = await runScript(`docker ${cmd}`, timeout);
+  return res && res.code === 0 ? res.stdout.trim() : null;
+}
+
+// Several docker subcommands in one shell round-trip; failed ones come back as null
+const batchScripts = new Map();
+
+async function dockerBatch(cmds, timeout = 10000) {
+  const key = cmds.join("\n");
+  let script = batchScripts.get(key);
+  if (!script) {
+    script = cmds.map(c => `docker ${c} || echo ${BATCH_FAIL}`).join(`; echo ${BATCH_SEP}; `);
+    batchScripts.set(key, script);
+  }
+  const res = await runScript(script, timeout);
+  if (!res || res.code !== 0) return cmds.map(() => null);
+  return res.stdout.split(BATCH_SEP).map(out => out.includes(BATCH_FAIL) ? null : out.trim());
+}
+
+// toRow may return null to drop a malformed line
+function parseRows(out, fallback, toRow) {
+  if (out === null) return fallback;
+  const rows = [];
+  for (const line of out.split("\n")) {
+    const fields = line && parseFields(line);
+    const row = fields && toRow(fields);
+    if (row) rows.push(row);
+  }
+  return rows;
+}
+
+// Each row is a JSON array of the requested fields (see rowFormat)
+function parseFields(line) {
+  try {
+    const fields = JSON.parse(line);
+    return Array.isArray(fields) ? fields : null;
+  } catch { return null; }
+}
+
+function containerRow(c) {
+  c.running = c.state === "running";
+  c.paused = c.status.includes("Paused");
+  c.healthy = c.status.includes("healthy");
+  return c;
+}
+
+const parseContainers = out => parseRows(out, state.containers, ([name, status = "", id, image, ports, st]) =>
+  containerRow({ name, status, id: id?.substring(0, 12) || "N/A", image, ports: ports || "", state: st || "unknown" }));
+
+const parseImages = out => parseRows(out, state.images, ([repo, tag, size, id]) =>
+  ({ repo, tag, size, id: id?.substring(0, 12) || "N/A" }));
+
+const parseVolumes = out => parseRows(out, state.volumes, ([driver, name]) =>
+  name ? { driver: driver || "local", name } : null);
+
+const parseNetworks = out => parseRows(out, state.networks, ([driver, name]) =>
+  name ? { driver: driver || "bridge", name } : null);
+
+// ==================== ENGINE API ====================
+// Direct dockerd access over its local socket; http is loaded lazily
+const engine = { socketPath: null, http: null, agent: null };
+
+function engineHttp() {
+  if (!engine.http) {
+    engine.http = require('http');
+    engine.agent = new engine.http.Agent({ keepAlive: true, maxSockets: 4 });
+  }
+  return engine.http;
+}
+
+// Only the local unix socket the CLI's own context points at
+async function engineSockets() {
+  if (isWindows) return [];
+  const res = await dockerRun(["context", "inspect", "--format", "{{.Endpoints.docker.Host}}"], 5000);
+  // Pre-context CLIs
+  const host = res.code === 0 ? res.stdout.trim() : process.env.DOCKER_HOST || "unix:///var/run/docker.sock";
+  return host.startsWith("unix://") ? [host.slice(7)] : [];
+}
+
+function engineRequest(reqPath, { method = "GET", timeout = 5000, socketPath = engine.socketPath } = {}) {
+  return new Promise(resolve => {
+    const req = engineHttp().request({ socketPath, path: reqPath, method, agent: engine.agent, timeout }, res => {
+      let body = "";
+      res.setEncoding("utf8");
+      res.on("data", chunk => body += chunk);
+      res.on("end", () => {
+        if (res.statusCode >= 300) return resolve(null);
+        try { resolve(body ? JSON.parse(body) : {}); } catch { resolve(body); }
+      });
+    });
+    req.on("timeout", () => req.destroy());
+    req.on("error", () => resolve(null));
+    req.end();
   });
 }
 
-async function getNetworks() {
-  const out = await dockerExec('network ls --format "{{.Driver}}|{{.Name}}"');
-  if (out === null) return state.networks;
-  if (!out) return [];
-  return out.split("\n").filter(Boolean).map(line => {
-    const [driver, name] = line.split("|");
-    return { driver: driver || "bridge", name: name || "N/A" };
+async function detectEngine() {
+  for (const socketPath of await engineSockets()) {
+    if (!fs.existsSync(socketPath)) continue;
+    if (await engineRequest("/_ping", { socketPath, timeout: 2000 }) === "OK") {
+      engine.socketPath = socketPath;
+      return true;
+    }
+  }
+  return false;
+}
+
+// Same rounding as the CLI's SIZE column
+function dockerSize(n) {
+  const units = ["B", "kB", "MB", "GB", "TB"];
+  let i = 0;
+  while (n >= 1000 && i < units.length - 1) { n /= 1000; i++; }
+  return `${parseFloat(n.toPrecision(3))}${units[i]}`;
+}
+
+function formatPorts(ports = []) {
+  return ports.map(p => p.PublicPort
+    ? `${p.IP === "::" ? "[::]" : p.IP || "0.0.0.0"}:${p.PublicPort}->${p.PrivatePort}/${p.Type}`
+    : `${p.PrivatePort}/${p.Type}`).join(", ");
+}
+
+const byName = (a, b) => a.name.localeCompare(b.name);
+
+function containersFromApi(list) {
+  if (!Array.isArray(list)) return state.containers;
+  return list.map(c => containerRow({
+    name: c.Names?.[0]?.replace(/^\//, "") || "N/A", status: c.Status || "", id: c.Id?.substring(0, 12) || "N/A",
+    image: c.Image, ports: formatPorts(c.Ports), state: c.State || "unknown",
+  }));
+}
+
+function imagesFromApi(list) {
+  if (!Array.isArray(list)) return state.images;
+  return list.flatMap(img => {
+    const id = img.Id?.replace(/^sha256:/, "").substring(0, 12) || "N/A";
+    const tags = img.RepoTags?.length ? img.RepoTags : ["<none>:<none>"];
+    return tags.map(t => {
+      const sep = t.lastIndexOf(":");
+      return { repo: t.substring(0, sep), tag: t.substring(sep + 1), size: dockerSize(img.Size || 0), id };
+    });
   });
 }
 
+function volumesFromApi(res) {
+  if (!Array.isArray(res?.Volumes)) return state.volumes;
+  return res.Volumes.map(v => ({ driver: v.Driver || "local", name: v.Name || "N/A" })).sort(byName);
+}
+
+function networksFromApi(list) {
+  if (!Array.isArray(list)) return state.networks;
+  return list.map(n => ({ driver: n.Driver || "bridge", name: n.Name || "N/A" })).sort(byName);
+}
+
+// One JSON array per row, e.g. ["web","Up 2 hours"]
+const rowFormat = (...fields) => `--format "[${fields.map(f => `{{json .${f}}}`).join(",")}]"`;
+
+const LISTS = {
+  containers: { cmd: `ps -a ${rowFormat("Names", "Status", "ID", "Image", "Ports", "State")}`, parse: parseContainers, api: "/containers/json?all=1", fromApi: containersFromApi },
+  images: { cmd: `images ${rowFormat("Repository", "Tag", "Size", "ID")}`, parse: parseImages, api: "/images/json", fromApi: imagesFromApi },
+  volumes: { cmd: `volume ls ${rowFormat("Driver", "Name")}`, parse: parseVolumes, api: "/volumes", fromApi: volumesFromApi },
+  networks: { cmd: `network ls ${rowFormat("Driver", "Name")}`, parse: parseNetworks, api: "/networks", fromApi: networksFromApi },
+};
+
+// Shell, client and daemon checks in one script
+async function checkDocker() {
+  const res = await runScript("{ docker --version >/dev/null 2>&1 && echo D:1 || echo D:0; } & { docker version --format '{{.Server.Version}}' >/dev/null 2>&1 && echo R:1 || echo R:0; } & wait", 10000);
+  const out = res?.code === 0 ? res.stdout : "";
+  return { shell: out !== "", client: out.includes("D:1"), daemon: out.includes("R:1") };
+}
+
+// Several lists in one round-trip, keyed like LISTS
+async function fetchLists(keys) {
+  if (engine.socketPath) {
+    const results = await Promise.all(keys.map(k => engineRequest(LISTS[k].api)));
+    return Object.fromEntries(keys.map((k, i) => [k, LISTS[k].fromApi(results[i])]));
+  }
+  const outs = await dockerBatch(keys.map(k => LISTS[k].cmd));
+  return Object.fromEntries(keys.map((k, i) => [k, LISTS[k].parse(outs[i])]));
+}
+
+const getContainers = async () => (await fetchLists(["containers"])).containers;
+const getImages = async () => (await fetchLists(["images"])).images;
+const getVolumes = async () => (await fetchLists(["volumes"])).volumes;
+const getNetworks = async () => (await fetchLists(["networks"])).networks;
+
 async function getContainerEnv(name) {
+  if (engine.socketPath) return (await getContainerInspect(name))?.Config?.Env || [];
   const out = await dockerExec(`inspect --format "{{range .Config.Env}}{{println .}}{{end}}" ${name}`);
   return out ? out.split("\n").filter(Boolean) : [];
 }
 
 async function getContainerTop(name) {
+  if (engine.socketPath) {
+    const top = await engineRequest(`/containers/${encodeURIComponent(name)}/top`);
+    if (!top?.Titles) return "Container not running";
+    const rows = [top.Titles, ...(top.Processes || [])];
+    const widths = top.Titles.map((_, i) => Math.max(...rows.map(r => (r[i] || "").length)));
+    return rows.map(r => r.map((v, i) => i === r.length - 1 ? v : (v || "").padEnd(widths[i])).join("   ")).join("\n");
+  }
   const out = await dockerExec(`top ${name}`);
   return out || "Container not running";
 }
 
 async function getContainerInspect(name) {
+  if (engine.socketPath) return engineRequest(`/containers/${encodeURIComponent(name)}/json`);
   const out = await dockerExec(`inspect ${name}`);
   try { return JSON.parse(out)[0]; } catch { return null; }
 }
 
 // ==================== CONTAINER ACTIONS ====================
-async function startContainer(name) {
-  await dockerExec(`start ${name}`, 30000);
-  notify(`Started ${name}`, "green");
+const containerLabel = names => names.length === 1 ? names[0] : `${names.length} container(s)`;
+
+async function containerAction(action, names, timeout) {
+  if (engine.socketPath) {
+    await Promise.all(names.map(n => engineRequest(`/containers/${encodeURIComponent(n)}/${action}`, { method: "POST", timeout })));
+    return;
+  }
+  // Names are handled in parallel
+  await dockerExec(`${action} ${names.join(" ")}`, timeout + 2000 * (names.length - 1));
+}
+
+async function startContainer(...names) {
+  await containerAction("start", names, 30000);
+  notify(`Started ${containerLabel(names)}`, "green");
   await updateAll();
 }
 
-async function stopContainer(name) {
-  await dockerExec(`stop ${name}`, 30000);
-  notify(`Stopped ${name}`, "yellow");
+async function stopContainer(...names) {
+  await containerAction("stop", names, 30000);
+  notify(`Stopped ${containerLabel(names)}`, "yellow");
   await updateAll();
 }
 
-async function restartContainer(name) {
-  await dockerExec(`restart ${name}`, 60000);
-  notify(`Restarted ${name}`, "green");
+async function restartContainer(...names) {
+  await containerAction("restart", names, 60000);
+  notify(`Restarted ${containerLabel(names)}`, "green");
   await updateAll();
 }
 
 async function deleteContainer(name) {
-  try {
-    const result = await execPromise(`${dockerCmd} rm -f ${name}`, { timeout: 30000 });
-    notify(`Deleted ${name}`, "red");
-    await updateAll();
-  } catch (error) {
-    notify(`Failed to delete container: ${error.message}`, "red");
-  }
+  const res = await dockerRun(["rm", "-f", name], 30000);
+  if (res.code !== 0) return notify(`Failed to delete container: ${failure(res)}`, "red");
+  notify(`Deleted ${name}`, "red");
+  await updateAll();
 }
 
 async function deleteImage(id) {
-  try {
-    const result = await execPromise(`${dockerCmd} rmi -f ${id}`, { timeout: 30000 });
-    notify(`Deleted image ${id}`, "yellow");
-    await updateImages();
-  } catch (error) {
-    notify(`Failed to delete image: ${error.message}`, "red");
-  }
+  const res = await dockerRun(["rmi", "-f", id], 30000);
+  if (res.code !== 0) return notify(`Failed to delete image: ${failure(res)}`, "red");
+  notify(`Deleted image ${id}`, "yellow");
+  await updateImages();
 }
 
-async function deleteVolume(name) {
-  try {
-    const result = await execPromise(`${dockerCmd} volume rm -f ${name}`, { timeout: 30000 });
-    notify(`Deleted volume ${name}`, "magenta");
-    await updateVolumes();
-  } catch (error) {
-    notify(`Failed to delete volume: ${error.message}`, "red");
+// Removed volumes are echoed on stdout
+async function deleteVolume(...names) {
+  const res = await dockerRun(["volume", "rm", "-f", ...names], 30000);
+  if (res.code !== 0) {
+    const failed = names.length - res.stdout.split("\n").filter(Boolean).length;
+    const what = names.length === 1 ? "volume" : `${failed} of ${names.length} volume(s)`;
+    notify(`Failed to delete ${what}: ${failure(res)}`, "red");
+  } else {
+    notify(`Deleted ${names.length === 1 ? `volume ${names[0]}` : `${names.length} volume(s)`}`, "magenta");
   }
+  await updateVolumes();
 }
 
 async function deleteNetwork(name) {
-  try {
-    const result = await execPromise(`${dockerCmd} network rm ${name}`, { timeout: 5000 });
-    notify(`Deleted network ${name}`, "yellow");
-    await updateAll();
-  } catch (error) {
-    notify(`Failed to delete network: ${error.message}`, "red");
-  }
+  const res = await dockerRun(["network", "rm", name], 5000);
+  if (res.code !== 0) return notify(`Failed to delete network: ${failure(res)}`, "red");
+  notify(`Deleted network ${name}`, "yellow");
+  await updateAll();
+}
+
+// ==================== PROCESS LIFECYCLE ====================
+// Streams get their own process group
+function spawnStream(args, stdio) {
+  return spawn(dockerFile, args, { stdio, detached: !isWindows, windowsHide: true });
+}
+
+// SIGTERM, then SIGKILL after the grace period
+function terminate(proc, graceMs = 2000) {
+  if (!proc || proc.exitCode !== null || proc.signalCode !== null) return;
+  if (isWindows) return killTree(proc);
+  const signal = sig => {
+    try { process.kill(-proc.pid, sig); } catch (_) {
+      try { proc.kill(sig); } catch (_) {}
+    }
+  };
+  signal("SIGTERM");
+  const timer = setTimeout(() => signal("SIGKILL"), graceMs);
+  timer.unref();
+  proc.once("exit", () => clearTimeout(timer));
+}
+
+// Complete lines per chunk; the partial tail is carried over
+function readLines(stream, onLines) {
+  let partial = "";
+  stream.setEncoding("utf8");
+  stream.on("data", chunk => {
+    const lines = (partial + chunk).split("\n");
+    partial = lines.pop();
+    if (lines.length > 0) onLines(lines);
+  });
 }
 
 // ==================== STATS STREAMING ====================
 function startStatsStream() {
-  if (state.statsProcess) try { state.statsProcess.kill(); } catch (_) {}
+  terminate(state.statsProcess);
   
-  const [cmd, ...args] = [...dockerCmd.split(" "), "stats", "--no-stream=false", "--format", "table {{.Name}}\t{{.CPUPerc}}\t{{.MemPerc}}\t{{.MemUsage}}\t{{.NetIO}}\t{{.BlockIO}}\t{{.PIDs}}"];
-  state.statsProcess = spawn(cmd, args, { stdio: ["ignore", "pipe", "pipe"] });
+  const proc = spawnStream(STATS_ARGS, ["ignore", "pipe", "ignore"]);
+  state.statsProcess = proc;
   
-  let buffer = "";
-  state.statsProcess.stdout.on("data", chunk => {
-    buffer += chunk.toString();
-    const lines = buffer.split("\n");
-    buffer = lines.pop();
+  readLines(proc.stdout, lines => {
+    state.statsRetryDelay = STATS_RETRY_MIN;
     
     lines.forEach(line => {
-      if (!line.trim() || line.startsWith("NAME")) return;
-      const parts = line.split(/\s{2,}|\t/);
-      if (parts.length < 7) return;
-      
-      const [name, cpuStr, memStr, memUsage, netIO, blockIO, pids] = parts;
-      if (!name) return;
+      const m = STATS_ROW_RE.exec(line);
+      if (!m) return;
       
-      const cpu = parseFloat(cpuStr?.replace("%", "")) || 0;
-      const mem = parseFloat(memStr?.replace("%", "")) || 0;
+      const [, name, cpuStr, memStr, memUsage, netIO, blockIO, pids] = m;
+      // "--" while a container starts reads as 0
+      const cpu = parseFloat(cpuStr) || 0;
+      const mem = parseFloat(memStr) || 0;
       
       state.stats[name] = { cpu, mem, memUsage: memUsage || "N/A", netIO: netIO || "N/A", blockIO: blockIO || "N/A", pids: pids || "N/A" };
       
@@ -324,46 +681,357 @@ function startStatsStream() {
     if (!state.inFullscreenMode && state.currentTab === 1) updateStatsTab();
   });
   
-  state.statsProcess.on("close", () => {
+  // Reconnect with backoff
+  proc.on("close", () => {
+    const delay = state.statsRetryDelay;
+    state.statsRetryDelay = Math.min(delay * 2, STATS_RETRY_MAX);
+    setTimeout(() => {
+      if (!state.inFullscreenMode && state.statsProcess === proc) startStatsStream();
+    }, delay);
+  });
+}
+
+// ==================== EVENTS ====================
+// Refetch lists only when docker events reports a change
+const EVENT_LISTS = { container: "containers", image: "images", volume: "volumes", network: "networks" };
+
+function startEventStream() {
+  terminate(state.eventsProcess);
+  
+  const proc = spawnStream(EVENTS_ARGS, ["ignore", "pipe", "ignore"]);
+  state.eventsProcess = proc;
+  
+  readLines(proc.stdout, lines => {
+    for (const line of lines) {
+      let ev;
+      try { ev = JSON.parse(line); } catch { continue; }
+      // Healthcheck execs change no row
+      if (ev.Action?.startsWith("exec_")) continue;
+      const key = EVENT_LISTS[ev.Type];
+      if (key) state.eventKeys.add(key);
+    }
+    // Refetch once a burst settles
+    if (state.eventKeys.size > 0) {
+      if (state.eventTimer) clearTimeout(state.eventTimer);
+      state.eventTimer = setTimeout(applyEvents, EVENT_REFRESH_MS);
+    }
+  });
+  
+  proc.on("close", () => {
+    if (state.eventsProcess !== proc) return;
+    state.eventsProcess = null;
     setTimeout(() => {
-      if (!state.inFullscreenMode && (!state.statsProcess || state.statsProcess.killed)) startStatsStream();
-    }, 2000);
+      if (!state.inFullscreenMode && !state.eventsProcess && !state.cleanedUp) startEventStream();
+    }, EVENT_RETRY_MS);
   });
 }
 
+async function applyEvents() {
+  state.eventTimer = null;
+  if (state.inFullscreenMode) return;
+  const keys = [...state.eventKeys];
+  state.eventKeys.clear();
+  const lists = await fetchLists(keys);
+  await Promise.all([
+    lists.containers && updateContainers(lists.containers),
+    lists.images && updateImages(false, lists.images),
+    lists.volumes && updateVolumes(false, lists.volumes),
+    lists.networks && updateNetworks(lists.networks),
+  ]);
+  screen.render();
+}
+
+function stopEventStream() {
+  if (state.eventTimer) clearTimeout(state.eventTimer);
+  state.eventTimer = null;
+  state.eventKeys.clear();
+  const proc = state.eventsProcess;
+  state.eventsProcess = null;
+  terminate(proc);
+}
+
+const listsFresh = poller => state.eventsProcess !== null && Date.now() - state.lastFullRefresh[poller] < FULL_REFRESH_MS;
+
 // ==================== LOGS ====================
-function showContainerLogs(name, tail = "10") {
+function showContainerLogs(name, tail = LOG_TAIL_LINES) {
   if (!name || state.inFullscreenMode) return;
-  stopLogStream();
+  const parked = state.parkedLog && state.parkedLog.name === name ? state.parkedLog : null;
+  if (parked) state.parkedLog = null;
+  parkLogStream();
+  state.logsJumpToEnd = true;
+  
+  if (parked) {
+    // Resume the parked tail
+    clearTimeout(parked.timer);
+    state.logTail = parked.tail;
+    state.logsContainer = name;
+    state.logsContent = parked.content;
+    state.logsLines = parked.lines;
+    state.logsPending = [];
+    state.logsPendingChars = 0;
+    parked.tail.resume();
+    scheduleLogFlush();
+    return;
+  }
   
   state.logsContent = "";
-  const [cmd, ...args] = [...dockerCmd.split(" "), "logs", "-f", "--tail", tail, name];
-  state.logProcess = spawn(cmd, args, { stdio: ['ignore', 'pipe', 'pipe'] });
+  state.logsLines = 0;
+  state.logsPending = [];
+  state.logsPendingChars = 0;
+  state.logsContainer = name;
+  const logTail = openLogTail(name, tail);
+  state.logTail = logTail;
   
   const onData = data => {
-    if (state.inFullscreenMode) return;
-    state.logsContent += data.toString();
-    if (state.logsContent.length > 100000) state.logsContent = state.logsContent.slice(-100000);
-    if (state.currentTab === 0) {
-      ui.contentBox.setContent(state.logsContent);
-      if (state.logsAutoScroll) ui.contentBox.setScrollPerc(100);
-      screen.render();
+    if (state.inFullscreenMode || state.logTail !== logTail) return;
+    state.logsPending.push(data);
+    state.logsPendingChars += data.length;
+    // Backpressure until the next flush
+    if (state.logsPendingChars > LOG_MAX_CHARS) logTail.pause();
+    scheduleLogFlush();
+  };
+  
+  // stderr in red, tagged per whole line
+  let errPartial = "";
+  const onStderr = data => {
+    const text = errPartial + data;
+    const eol = text.lastIndexOf("\n");
+    errPartial = text.slice(eol + 1);
+    if (eol !== -1) onData(text.slice(0, eol + 1).replace(/^.+$/gm, "{red-fg}$&{/red-fg}"));
+  };
+  
+  const [stdout, stderr] = logTail.streams;
+  stdout.on("data", onData);
+  stderr.on("data", onStderr);
+  stderr.on("end", () => errPartial && onData(`{red-fg}${errPartial}{/red-fg}`));
+  logTail.onClose(() => {
+    if (state.logTail === logTail) state.logTail = null;
+    else if (state.parkedLog && state.parkedLog.tail === logTail) dropParkedLog();
+  });
+}
+
+// Log tail over either transport
+function makeLogTail(streams, { onClose, stop, kill = stop }) {
+  streams.forEach(s => s.setEncoding("utf8"));
+  return {
+    streams,
+    onClose,
+    pause: () => streams.forEach(s => s.pause()),
+    resume: () => streams.forEach(s => s.resume()),
+    isPaused: () => streams[0].isPaused(),
+    stop: () => {
+      streams.forEach(s => s.destroy());
+      stop();
+    },
+    kill,
+  };
+}
+
+function openLogTail(name, tail) {
+  if (engine.socketPath) return engineLogTail(name, tail);
+  const proc = spawnStream([...LOGS_ARGS, tail, name], ["ignore", "pipe", "pipe"]);
+  return makeLogTail([proc.stdout, proc.stderr], {
+    onClose: cb => proc.on("close", cb),
+    stop: () => terminate(proc),
+    kill: () => killTree(proc),
+  });
+}
+
+// Engine API tail, on its own connection
+function engineLogTail(name, tail) {
+  const out = new PassThrough();
+  const err = new PassThrough();
+  const closed = [];
+  let open = 2;
+  [out, err].forEach(s => s.on("close", () => {
+    if (--open === 0) closed.forEach(cb => cb());
+  }));
+  const finish = () => {
+    out.end();
+    err.end();
+  };
+  
+  const req = engineHttp().request({
+    socketPath: engine.socketPath, agent: false,
+    path: `/containers/${encodeURIComponent(name)}/logs?follow=1&stdout=1&stderr=1&tail=${encodeURIComponent(tail)}`,
+  }, res => {
+    if (res.statusCode < 300) {
+      demuxLogs(res, out, err);
+    } else {
+      let body = "";
+      res.setEncoding("utf8");
+      res.on("data", chunk => body += chunk);
+      res.on("end", () => {
+        let message = body.trim();
+        try { message = JSON.parse(body).message || message; } catch (_) {}
+        err.write(`Error response from daemon: ${message}\n`);
+      });
     }
+    // After the parsers' end handlers
+    res.on("end", finish);
+    res.on("close", finish);
+  });
+  req.on("error", finish);
+  req.end();
+  
+  return makeLogTail([out, err], {
+    onClose: cb => closed.push(cb),
+    stop: () => req.destroy(),
+  });
+}
+
+// Split stdcopy frames (non-TTY) into stdout/stderr
+function demuxLogs(res, out, err) {
+  const type = res.headers["content-type"] || "";
+  let framed = type.includes("multiplexed") ? true : type.includes("raw-stream") ? false : null;
+  let buf = null;
+  const waiting = new Set();
+  const write = (stream, data) => {
+    if (stream.write(data) || waiting.has(stream)) return;
+    waiting.add(stream);
+    res.pause();
+    stream.once("drain", () => {
+      waiting.delete(stream);
+      if (waiting.size === 0) res.resume();
+    });
   };
   
-  state.logProcess.stdout.on("data", onData);
-  state.logProcess.stderr.on("data", onData);
+  res.on("data", chunk => {
+    buf = buf ? Buffer.concat([buf, chunk]) : chunk;
+    if (framed === null) {
+      if (buf.length < 8) return;
+      framed = buf[0] <= 2 && buf[1] === 0 && buf[2] === 0 && buf[3] === 0;
+    }
+    if (!framed) {
+      write(out, buf);
+      buf = null;
+      return;
+    }
+    let off = 0;
+    while (buf.length - off >= 8) {
+      const end = off + 8 + buf.readUInt32BE(off + 4);
+      if (end > buf.length) break;
+      write(buf[off] === 2 ? err : out, buf.subarray(off + 8, end));
+      off = end;
+    }
+    buf = off < buf.length ? buf.subarray(off) : null;
+  });
+  res.on("end", () => {
+    if (buf && !framed) out.write(buf);
+  });
+}
+
+// Pause the previous tail for reuse instead of killing it
+function parkLogStream() {
+  if (state.logSwitchTimer) {
+    clearTimeout(state.logSwitchTimer);
+    state.logSwitchTimer = null;
+  }
+  if (state.logFlushTimer) {
+    clearTimeout(state.logFlushTimer);
+    state.logFlushTimer = null;
+  }
+  const logTail = state.logTail;
+  if (logTail) {
+    drainLogPending();
+    logTail.pause();
+    dropParkedLog();
+    state.parkedLog = {
+      name: state.logsContainer,
+      tail: logTail,
+      content: state.logsContent,
+      lines: state.logsLines,
+      timer: setTimeout(dropParkedLog, LOG_PARK_MS),
+    };
+  }
+  state.logTail = null;
+  state.logsContainer = null;
+}
+
+function dropParkedLog() {
+  const parked = state.parkedLog;
+  if (!parked) return;
+  state.parkedLog = null;
+  clearTimeout(parked.timer);
+  parked.tail.stop();
+}
+
+// Debounced so scrolling doesn't spawn a tail per row
+function switchLogStream(name) {
+  if (state.logSwitchTimer) clearTimeout(state.logSwitchTimer);
+  state.logSwitchTimer = null;
+  // Same container: keep the running tail
+  if (state.logTail && state.logsContainer === name) return;
+  state.logSwitchTimer = setTimeout(() => {
+    state.logSwitchTimer = null;
+    showContainerLogs(name);
+  }, LOG_SWITCH_DELAY_MS);
+}
+
+function scheduleLogFlush() {
+  if (!state.logFlushTimer) state.logFlushTimer = setTimeout(flushLogs, LOG_FLUSH_MS);
+}
+
+function countLines(text) {
+  let n = 0;
+  for (let i = text.indexOf("\n"); i !== -1; i = text.indexOf("\n", i + 1)) n++;
+  return n;
+}
+
+// Trim to LOG_KEEP_CHARS / LOG_KEEP_LINES on a line boundary
+function trimLogs(text) {
+  let start = Math.max(text.length - LOG_KEEP_CHARS, 0);
+  const eol = text.indexOf("\n", start);
+  if (eol !== -1 && eol < text.length - 1) start = eol + 1;
+  let cut = text.endsWith("\n") ? text.length - 1 : text.length;
+  for (let n = 0; n < LOG_KEEP_LINES && cut > start; n++) cut = text.lastIndexOf("\n", cut - 1);
+  const from = Math.max(start, cut + 1);
+  return text.slice(from < text.length ? from : start);
+}
+
+function drainLogPending() {
+  if (state.logsPending.length === 0) return;
+  const batch = state.logsPending.join("");
+  state.logsContent += batch;
+  state.logsLines += countLines(batch);
+  state.logsPending = [];
+  state.logsPendingChars = 0;
+  if (state.logsContent.length > LOG_MAX_CHARS || state.logsLines > LOG_MAX_LINES) {
+    state.logsContent = trimLogs(state.logsContent);
+    state.logsLines = countLines(state.logsContent);
+  }
+}
+
+function flushLogs() {
+  state.logFlushTimer = null;
+  if (state.logsPending.length > 0) {
+    drainLogPending();
+    if (state.logTail && state.logTail.isPaused()) state.logTail.resume();
+  }
+  if (state.inFullscreenMode || state.currentTab !== 0) return;
+  // Follow only while at the bottom
+  const perc = ui.contentBox.getScrollPerc(true);
+  ui.contentBox.setContent(state.logsContent);
+  if (state.logsAutoScroll && (state.logsJumpToEnd || perc === -1 || perc >= 100)) ui.contentBox.setScrollPerc(100);
+  state.logsJumpToEnd = false;
+  screen.render();
 }
 
 function stopLogStream() {
-  if (state.logProcess) {
-    try {
-      if (state.logProcess.stdout) state.logProcess.stdout.destroy();
-      if (state.logProcess.stderr) state.logProcess.stderr.destroy();
-      state.logProcess.kill('SIGKILL');
-    } catch (_) {}
-    state.logProcess = null;
+  if (state.logSwitchTimer) {
+    clearTimeout(state.logSwitchTimer);
+    state.logSwitchTimer = null;
+  }
+  if (state.logFlushTimer) {
+    clearTimeout(state.logFlushTimer);
+    state.logFlushTimer = null;
   }
+  if (state.logTail) {
+    state.logTail.stop();
+    state.logTail = null;
+  }
+  state.logsContainer = null;
+  dropParkedLog();
 }
 
 // ==================== CHARTS ====================
@@ -423,6 +1091,10 @@ function smoothChart(data, height = 12, width = 60, color = "cyan", label = "")
   return rows.join("\n");
 }
 
+function parseBytes(s) {
+  return parseFloat(s.match(LEADING_NUMBER_RE)?.[1] || 0);
+}
+
 function humanBytes(n) {
   const units = ["B", "kB", "MB", "GB", "TB"];
   let i = 0;
@@ -444,51 +1116,74 @@ function updateHelpBar() {
   ui.helpBar.setContent("{bold}q{/}:Quit {bold}←→{/}:Tabs {bold}↑↓{/}:Nav {bold}s{/}:Start/Stop {bold}r{/}:Restart {bold}t{/}:Exec {bold}d{/}:Delete {bold}m{/}:Mark {bold}C-a{/}:SelectAll {bold}l{/}:Logs {bold}a{/}:AutoScroll {bold}F5{/}:Refresh");
 }
 
-function updateListIfChanged(list, newData, formatFn, indexRef) {
+// Keyed row diff; keeps the selection, caller renders
+function updateListIfChanged(list, newData, formatFn, keyFn) {
   if (!newData || newData.length === 0) {
     const def = ["{yellow-fg}No items{/yellow-fg}"];
     if (list.items.length !== 1 || list.items[0].content !== def[0]) {
       list.setItems(def);
       list.select(0);
-      screen.render();
     }
-    indexRef[0] = 0;
+    list.rowKeys = [];
     return;
   }
   
   const newItems = newData.map(formatFn);
-  const hasChanged = list.items.length !== newItems.length || list.items.some((item, i) => item.content !== newItems[i]);
+  const newKeys = newData.map(keyFn);
+  const oldKeys = list.rowKeys?.length === list.items.length ? list.rowKeys : [];
+  const plan = planRowEdits(list, oldKeys, newKeys, newItems);
+  if (plan && plan.edits === 0) return;
   
-  if (hasChanged) {
-    const wasFocused = screen.focused === list;
-    const cur = list.selected;
+  const wasFocused = screen.focused === list;
+  const selectedKey = oldKeys[list.selected];
+  if (!plan || oldKeys.length === 0 || plan.edits > newItems.length / 2) {
     list.setItems(newItems);
-    const idx = Math.min(cur, newItems.length - 1);
-    list.select(Math.max(0, idx));
-    if (wasFocused) list.focus();
-    screen.render();
-    indexRef[0] = Math.max(0, idx);
   } else {
-    indexRef[0] = list.selected;
+    plan.removed.forEach(i => list.removeItem(i));
+    plan.inserted.forEach(i => list.insertItem(i, newItems[i]));
+    plan.updated.forEach(i => list.setItem(i, newItems[i]));
+  }
+  list.rowKeys = newKeys;
+  const keep = newKeys.indexOf(selectedKey);
+  list.select(keep !== -1 ? keep : Math.max(0, Math.min(list.selected, newItems.length - 1)));
+  if (wasFocused) list.focus();
+}
+
+// null when surviving rows reorder or keys repeat
+function planRowEdits(list, oldKeys, newKeys, newItems) {
+  const wanted = new Set(newKeys);
+  if (wanted.size !== newKeys.length) return null;
+  const removed = [];
+  for (let i = oldKeys.length - 1; i >= 0; i--) if (!wanted.has(oldKeys[i])) removed.push(i);
+  const kept = oldKeys.filter(k => wanted.has(k));
+  const keptSet = new Set(kept);
+  const oldIndex = new Map(oldKeys.map((k, i) => [k, i]));
+  const inserted = [];
+  const updated = [];
+  let next = 0;
+  for (let i = 0; i < newKeys.length; i++) {
+    if (!keptSet.has(newKeys[i])) { inserted.push(i); continue; }
+    if (newKeys[i] !== kept[next++]) return null;
+    if (list.items[oldIndex.get(newKeys[i])].content !== newItems[i]) updated.push(i);
   }
+  return { removed, inserted, updated, edits: removed.length + inserted.length + updated.length };
 }
 
-async function updateContainers() {
+async function updateContainers(prefetched = null) {
   try {
-    state.containers = await getContainers();
+    state.containers = prefetched ?? await getContainers();
     const fmt = c => {
       const st = state.stats[c.name] || { cpu: 0, mem: 0 };
-      const running = c.state === "running";
-      const paused = c.status.includes("Paused");
-      let status = running ? (paused ? "{yellow-fg}paused{/yellow-fg}" : "{green-fg}running{/green-fg}") : "{red-fg}exited{/red-fg}";
-      if (c.status.includes("healthy")) status = "{green-fg}running (healthy){/green-fg}";
+      const running = c.running;
+      let status = running ? (c.paused ? "{yellow-fg}paused{/yellow-fg}" : "{green-fg}running{/green-fg}") : "{red-fg}exited{/red-fg}";
+      if (c.healthy) status = "{green-fg}running (healthy){/green-fg}";
       const mark = state.markedContainers.has(c.name) ? "{white-bg}{black-fg}[✓]{/black-fg}{/white-bg} " : "    ";
       const name = c.name.substring(0, 18).padEnd(18);
       const cpu = running ? `${st.cpu.toFixed(2)}%`.padStart(7) : "      -";
       const ports = c.ports?.substring(0, 12) || "";
       return `${mark}${status.padEnd(25)} {bold}${name}{/bold} ${cpu} {cyan-fg}${ports}{/cyan-fg}`;
     };
-    updateListIfChanged(ui.containersBox, state.containers, fmt, [state.selectedContainerIndex]);
+    updateListIfChanged(ui.containersBox, state.containers, fmt, c => c.name);
     state.selectedContainerIndex = ui.containersBox.selected;
     updateHelpBar();
   } catch (err) {
@@ -496,42 +1191,41 @@ async function updateContainers() {
   }
 }
 
-async function updateImages(force = false) {
+async function updateImages(force = false, prefetched = null) {
   try {
-    const imgs = await getImages();
+    const imgs = prefetched ?? await getImages();
     if (!force && JSON.stringify(imgs) === JSON.stringify(state.images)) return;
     state.images = imgs;
     const fmt = img => {
       const mark = state.markedImages.has(img.id) ? "{white-bg}{black-fg}[✓]{/black-fg}{/white-bg} " : "    ";
       return `${mark}${img.repo.substring(0, 20).padEnd(20)} {yellow-fg}${img.tag.substring(0, 10).padEnd(10)}{/yellow-fg} ${img.size.padEnd(10)}`;
     };
-    updateListIfChanged(ui.imagesBox, state.images, fmt, [state.selectedImageIndex]);
+    updateListIfChanged(ui.imagesBox, state.images, fmt, img => `${img.id}|${img.repo}:${img.tag}`);
     state.selectedImageIndex = ui.imagesBox.selected;
   } catch { ui.imagesBox.setItems(["{red-fg}Error{/red-fg}"]); }
 }
 
-async function updateVolumes(force = false) {
+async function updateVolumes(force = false, prefetched = null) {
   try {
-    const vols = await getVolumes();
+    const vols = prefetched ?? await getVolumes();
     if (!force && JSON.stringify(vols) === JSON.stringify(state.volumes)) return;
     state.volumes = vols;
     const fmt = v => {
       const mark = state.markedVolumes.has(v.name) ? "{white-bg}{black-fg}[✓]{/black-fg}{/white-bg} " : "    ";
       return `${mark}{magenta-fg}${v.driver.padEnd(8)}{/magenta-fg} ${v.name}`;
     };
-    updateListIfChanged(ui.volumesBox, state.volumes, fmt, [state.selectedVolumeIndex]);
+    updateListIfChanged(ui.volumesBox, state.volumes, fmt, v => v.name);
     state.selectedVolumeIndex = ui.volumesBox.selected;
   } catch { ui.volumesBox.setItems(["{red-fg}Error{/red-fg}"]); }
 }
 
-async function updateNetworks() {
+async function updateNetworks(prefetched = null) {
   try {
-    const nets = await getNetworks();
+    const nets = prefetched ?? await getNetworks();
     if (JSON.stringify(nets) === JSON.stringify(state.networks)) return;
     state.networks = nets;
-    const sys = ['bridge', 'host', 'none'];
-    const fmt = n => sys.includes(n.name) ? `{gray-fg}${n.driver.padEnd(8)} ${n.name} (system){/gray-fg}` : `{blue-fg}${n.driver.padEnd(8)}{/blue-fg} ${n.name}`;
-    updateListIfChanged(ui.networksBox, state.networks, fmt, [state.selectedNetworkIndex]);
+    const fmt = n => SYSTEM_NETWORKS.has(n.name) ? `{gray-fg}${n.driver.padEnd(8)} ${n.name} (system){/gray-fg}` : `{blue-fg}${n.driver.padEnd(8)}{/blue-fg} ${n.name}`;
+    updateListIfChanged(ui.networksBox, state.networks, fmt, n => n.name);
     state.selectedNetworkIndex = ui.networksBox.selected;
   } catch { ui.networksBox.setItems(["{red-fg}Error{/red-fg}"]); }
 }
@@ -540,15 +1234,44 @@ async function updateAll() {
   state.env = {};
   state.config = {};
   state.top = {};
-  await Promise.all([updateContainers(), updateImages(), updateVolumes(), updateNetworks()]);
+  const { containers, images, volumes, networks } = await fetchLists(["containers", "images", "volumes", "networks"]);
+  await Promise.all([updateContainers(containers), updateImages(false, images), updateVolumes(false, volumes), updateNetworks(networks)]);
   await updateCurrentTab();
   screen.render();
 }
 
+async function updateMisc() {
+  const { images, volumes, networks } = await fetchLists(["images", "volumes", "networks"]);
+  await Promise.all([updateImages(false, images), updateVolumes(false, volumes), updateNetworks(networks)]);
+}
+
+function startPolling() {
+  startEventStream();
+  state.lastFullRefresh.containers = state.lastFullRefresh.misc = Date.now();
+  state.containersInterval = setInterval(async () => {
+    if (listsFresh("containers")) {
+      await updateContainers(state.containers);
+    } else {
+      state.lastFullRefresh.containers = Date.now();
+      await updateContainers();
+    }
+    if (state.currentTab === 1) updateStatsTab();
+    screen.render();
+  }, 3000);
+  state.miscInterval = setInterval(async () => {
+    if (listsFresh("misc")) return;
+    state.lastFullRefresh.misc = Date.now();
+    await updateMisc();
+    screen.render();
+  }, 15000);
+}
+
 // ==================== TAB CONTENT ====================
 function updateLogsTab() {
   const c = state.containers[state.selectedContainerIndex];
   ui.contentBox.setContent(c ? (state.logsContent || "{gray-fg}No logs yet...{/gray-fg}") : "{yellow-fg}No container selected{/yellow-fg}");
+  if (state.logsAutoScroll) ui.contentBox.setScrollPerc(100);
+  state.logsJumpToEnd = true;
   screen.render();
 }
 
@@ -561,7 +1284,7 @@ function updateStatsTab() {
   }
   
   const st = state.stats[c.name] || {};
-  const running = c.state === "running";
+  const running = c.running;
   
   if (!state.cpuHistory[c.name]) state.cpuHistory[c.name] = [0];
   if (!state.memHistory[c.name]) state.memHistory[c.name] = [0];
@@ -576,7 +1299,6 @@ function updateStatsTab() {
     
     const [rx, tx] = (st.netIO || "0B / 0B").split(" / ");
     const [read, write] = (st.blockIO || "0B / 0B").split(" / ");
-    const parseBytes = s => parseFloat(s.match(/^([\d.]+)/)?.[1] || 0);
     
     out += `{bold}{yellow-fg}PIDs:{/yellow-fg}{/bold}     ${st.pids || "N/A"}\n`;
     out += `{bold}{blue-fg}Net RX:{/blue-fg}{/bold}   ${humanBytes(parseBytes(rx))}\n`;
@@ -716,7 +1438,7 @@ async function updateTopTab() {
     return;
   }
   
-  const topInfo = c.state === "running" ? await getContainerTop(c.name) : "Container is not running";
+  const topInfo = c.running ? await getContainerTop(c.name) : "Container is not running";
   state.top[c.name] = topInfo;
   renderTop(c.name, topInfo);
 }
@@ -724,7 +1446,7 @@ async function updateTopTab() {
 function renderTop(name, topInfo) {
   let content = `{bold}{cyan-fg}Top Processes: ${name}{/cyan-fg}{/bold}\n{gray-fg}${"─".repeat(55)}{/gray-fg}\n\n`;
   const c = state.containers[state.selectedContainerIndex];
-  content += c?.state === "running" ? `{green-fg}${topInfo}{/green-fg}\n\n` : "{gray-fg}Container is not running{/gray-fg}\n\n";
+  content += c?.running ? `{green-fg}${topInfo}{/green-fg}\n\n` : "{gray-fg}Container is not running{/gray-fg}\n\n";
   ui.contentBox.setContent(content);
   screen.render();
 }
@@ -740,60 +1462,77 @@ async function updateCurrentTab() {
   
   if (!c) return;
   
-  if (state.currentTab === 0 && (!state.logProcess || !state.logProcess.spawnargs?.includes(c.name))) {
-    showContainerLogs(c.name, "100");
+  if (state.currentTab === 0 && (!state.logTail || state.logsContainer !== c.name)) {
+    showContainerLogs(c.name);
     return;
   }
   
-  if (state.currentTab !== 0) stopLogStream();
-  
   const tabs = [updateLogsTab, updateStatsTab, updateEnvTab, updateConfigTab, updateTopTab];
   await tabs[state.currentTab]();
   screen.render();
 }
 
 // ==================== UTILITIES ====================
+const toast = { box: null, timer: null };
+
 function notify(msg, color = "green") {
-  const box = blessed.box({
-    top: "center", left: "center",
-    width: Math.min(msg.length + 6, 60), height: 3,
-    content: ` ${msg} `, border: { type: "line" },
-    style: { border: { fg: color }, fg: color, bg: "black" },
-  });
-  screen.append(box);
+  if (!toast.box) {
+    toast.box = blessed.box({
+      parent: screen, top: "center", left: "center", height: 3, hidden: true,
+      border: { type: "line" }, style: { border: { fg: color }, fg: color, bg: "black" },
+    });
+  }
+  toast.box.width = Math.min(msg.length + 6, 60);
+  toast.box.style.border.fg = color;
+  toast.box.style.fg = color;
+  toast.box.setContent(` ${msg} `);
+  toast.box.show();
+  toast.box.setFront();
   screen.render();
-  setTimeout(() => { screen.remove(box); screen.render(); }, 2000);
+  clearTimeout(toast.timer);
+  toast.timer = setTimeout(() => { toast.box.hide(); screen.render(); }, 2000);
 }
 
+let deleteDialog = null;
+
 function confirmDelete(prompt, onConfirm) {
-  const dialog = blessed.question({
-    parent: screen, top: "center", left: "center",
-    width: 50, height: 7, border: { type: "line" },
-    style: { border: { fg: "red" }, fg: "white", bg: "black" },
-  });
-  dialog.ask(prompt, (err, value) => {
-    if (value) onConfirm();
+  if (!deleteDialog) {
+    deleteDialog = blessed.question({
+      parent: screen, top: "center", left: "center",
+      width: 50, height: 7, border: { type: "line" },
+      style: { border: { fg: "red" }, fg: "white", bg: "black" },
+    });
+  }
+  deleteDialog.ask(prompt, async (err, value) => {
+    if (value) await onConfirm();
     screen.render();
   });
 }
 
 function cleanup() {
-  if (state.logProcess) try { state.logProcess.kill('SIGKILL'); } catch (_) {}
-  if (state.statsProcess) try { state.statsProcess.kill('SIGKILL'); } catch (_) {}
-  if (state.fullscreenChild) {
-    try { process.kill(-state.fullscreenChild.pid, 'SIGKILL'); } catch (_) {
-      try { state.fullscreenChild.kill('SIGKILL'); } catch (_) {}
-    }
-  }
-  if (state.containersInterval) clearInterval(state.containersInterval);
-  if (state.miscInterval) clearInterval(state.miscInterval);
+  if (state.cleanedUp) return;
+  state.cleanedUp = true;
+  [state.containersInterval, state.miscInterval].forEach(t => t && clearInterval(t));
+  [state.logFlushTimer, state.logSwitchTimer, state.detailTimer, state.eventTimer].forEach(t => t && clearTimeout(t));
+  if (state.parkedLog) clearTimeout(state.parkedLog.timer);
+  [state.logTail, state.parkedLog && state.parkedLog.tail].forEach(t => t && t.kill());
+  [state.fullscreenChild, state.dockerShell, state.statsProcess, state.eventsProcess].forEach(p => killTree(p));
+  captures.forEach(p => {
+    try { p.kill('SIGKILL'); } catch (_) {}
+  });
+  if (engine.agent) engine.agent.destroy();
+}
+
+function quit() {
+  cleanup();
+  screen.destroy();
+  process.exit(0);
 }
 
 // ==================== KEYBOARD HANDLERS ====================
 screen.key(["q", "C-c"], () => {
   if (state.inFullscreenMode) return;
-  cleanup();
-  process.exit(0);
+  quit();
 });
 
 screen.key(["F5"], () => !state.inFullscreenMode && updateAll());
@@ -886,22 +1625,23 @@ screen.key(["s"], async () => {
   
   if (state.markedContainers.size > 0) {
     const containers = state.containers.filter(c => state.markedContainers.has(c.name));
-    const toStart = containers.filter(c => c.state !== "running");
-    const toStop = containers.filter(c => c.state === "running");
+    const toStart = containers.filter(c => !c.running);
+    const toStop = containers.filter(c => c.running);
     
     if (toStart.length > 0) {
       notify(`Starting ${toStart.length} container(s)...`, "green");
-      for (const c of toStart) await startContainer(c.name);
+      await startContainer(...toStart.map(c => c.name));
     }
     if (toStop.length > 0) {
       notify(`Stopping ${toStop.length} container(s)...`, "yellow");
-      for (const c of toStop) await stopContainer(c.name);
+      await stopContainer(...toStop.map(c => c.name));
     }
     state.markedContainers.clear();
     await updateContainers();
+    screen.render();
   } else {
     const c = state.containers[state.selectedContainerIndex];
-    if (c) c.state === "running" ? await stopContainer(c.name) : await startContainer(c.name);
+    if (c) c.running ? await stopContainer(c.name) : await startContainer(c.name);
   }
 });
 
@@ -909,18 +1649,19 @@ screen.key(["r"], async () => {
   if (state.inFullscreenMode || screen.focused !== ui.containersBox) return;
   
   if (state.markedContainers.size > 0) {
-    const containers = state.containers.filter(c => state.markedContainers.has(c.name) && c.state === "running");
+    const containers = state.containers.filter(c => state.markedContainers.has(c.name) && c.running);
     if (containers.length > 0) {
       notify(`Restarting ${containers.length} container(s)...`, "blue");
-      for (const c of containers) await restartContainer(c.name);
+      await restartContainer(...containers.map(c => c.name));
     } else {
       notify("No running containers selected", "yellow");
     }
     state.markedContainers.clear();
     await updateContainers();
+    screen.render();
   } else {
     const c = state.containers[state.selectedContainerIndex];
-    if (c && c.state === "running") await restartContainer(c.name);
+    if (c && c.running) await restartContainer(c.name);
   }
 });
 
@@ -954,9 +1695,9 @@ screen.key(["d"], async () => {
   } else if (f === ui.volumesBox) {
     if (state.markedVolumes.size > 0) {
       confirmDelete(`Delete ${state.markedVolumes.size} volume(s)?`, async () => {
-        for (const name of state.markedVolumes) await deleteVolume(name);
+        const names = [...state.markedVolumes];
         state.markedVolumes.clear();
-        await updateVolumes();
+        await deleteVolume(...names);
       });
     } else {
       const vol = state.volumes[state.selectedVolumeIndex];
@@ -965,7 +1706,7 @@ screen.key(["d"], async () => {
   } else if (f === ui.networksBox) {
     const net = state.networks[state.selectedNetworkIndex];
     if (net) {
-      if (['bridge', 'host', 'none'].includes(net.name)) {
+      if (SYSTEM_NETWORKS.has(net.name)) {
         notify(`Cannot delete '${net.name}' - system network`, "yellow");
       } else {
         confirmDelete(`Delete network ${net.name}?`, () => deleteNetwork(net.name));
@@ -978,7 +1719,7 @@ screen.key(["d"], async () => {
 screen.key(["t"], () => {
   if (state.inFullscreenMode || screen.focused !== ui.containersBox) return;
   const c = state.containers[state.selectedContainerIndex];
-  if (!c || c.state !== "running") {
+  if (!c || !c.running) {
     notify("Container must be running", "red");
     return;
   }
@@ -987,7 +1728,8 @@ screen.key(["t"], () => {
   if (state.containersInterval) clearInterval(state.containersInterval);
   if (state.miscInterval) clearInterval(state.miscInterval);
   stopLogStream();
-  if (state.statsProcess) try { state.statsProcess.kill(); } catch (_) {}
+  stopEventStream();
+  terminate(state.statsProcess);
   
   screen.lockKeys = true;
   screen.program.showCursor();
@@ -999,10 +1741,9 @@ screen.key(["t"], () => {
   if (process.stdin.setRawMode) process.stdin.setRawMode(false);
   
   setTimeout(() => {
-    const shellCmd = isWindows ? `wsl docker exec -it ${c.name} sh -c "exec /bin/bash || exec /bin/sh"` : `docker exec -it ${c.name} sh -c "exec /bin/bash || exec /bin/sh"`;
     process.stdout.write('\r\n🐳 Entering shell in ' + c.name + '...\r\n📋 Press Ctrl+D to return\r\n\r\n');
     
-    const child = spawn(shellCmd, [], { stdio: "inherit", shell: true });
+    const child = spawn(dockerFile, [...EXEC_ARGS, c.name, "sh", "-c", SHELL_ENTRY], { stdio: "inherit" });
     state.fullscreenChild = child;
     
     child.on("exit", () => {
@@ -1016,23 +1757,14 @@ screen.key(["t"], () => {
         screen.program.alternateBuffer();
         screen.program.enableMouse();
         screen.program.hideCursor();
-        screen.alloc();
         screen.realloc();
         ui.containersBox.focus();
         updateTabHeader();
         await updateAll();
         startStatsStream();
-        state.containersInterval = setInterval(async () => {
-          await updateContainers();
-          if (state.currentTab === 1) updateStatsTab();
-          screen.render();
-        }, 3000);
-        state.miscInterval = setInterval(async () => {
-          await Promise.all([updateImages(), updateVolumes(), updateNetworks()]);
-          screen.render();
-        }, 15000);
+        startPolling();
         const cur = state.containers[state.selectedContainerIndex];
-        if (state.currentTab === 0 && cur) showContainerLogs(cur.name, "100");
+        if (state.currentTab === 0 && cur) showContainerLogs(cur.name);
         screen.render();
       }, 100);
     });
@@ -1043,7 +1775,7 @@ screen.key(["t"], () => {
 screen.key(["l"], () => {
   if (state.inFullscreenMode || screen.focused !== ui.containersBox) return;
   const c = state.containers[state.selectedContainerIndex];
-  if (!c || c.state !== "running") {
+  if (!c || !c.running) {
     notify("Container must be running", "red");
     return;
   }
@@ -1052,7 +1784,8 @@ screen.key(["l"], () => {
   if (state.containersInterval) clearInterval(state.containersInterval);
   if (state.miscInterval) clearInterval(state.miscInterval);
   stopLogStream();
-  if (state.statsProcess) try { state.statsProcess.kill(); } catch (_) {}
+  stopEventStream();
+  terminate(state.statsProcess);
   
   screen.lockKeys = true;
   screen.program.showCursor();
@@ -1064,11 +1797,10 @@ screen.key(["l"], () => {
   if (process.stdin.setRawMode) process.stdin.setRawMode(false);
   
   setTimeout(() => {
-    const cmdParts = isWindows ? ['wsl', 'docker', 'logs', '-f', c.name] : ['docker', 'logs', '-f', c.name];
     if (process.stdin.setRawMode) process.stdin.setRawMode(true);
     process.stdin.resume();
     
-    const child = spawn(cmdParts[0], cmdParts.slice(1), { stdio: ["ignore", "inherit", "inherit"], detached: !isWindows });
+    const child = spawn(dockerFile, [...LOGS_ARGS, FULLSCREEN_TAIL_LINES, c.name], { stdio: ["ignore", "inherit", "inherit"], detached: !isWindows });
     state.fullscreenChild = child;
     
     const onData = key => {
@@ -1090,23 +1822,14 @@ screen.key(["l"], () => {
         screen.program.alternateBuffer();
         screen.program.enableMouse();
         screen.program.hideCursor();
-        screen.alloc();
         screen.realloc();
         ui.containersBox.focus();
         updateTabHeader();
         await updateAll();
         startStatsStream();
-        state.containersInterval = setInterval(async () => {
-          await updateContainers();
-          if (state.currentTab === 1) updateStatsTab();
-          screen.render();
-        }, 3000);
-        state.miscInterval = setInterval(async () => {
-          await Promise.all([updateImages(), updateVolumes(), updateNetworks()]);
-          screen.render();
-        }, 15000);
+        startPolling();
         const cur = state.containers[state.selectedContainerIndex];
-        if (state.currentTab === 0 && cur) showContainerLogs(cur.name, "100");
+        if (state.currentTab === 0 && cur) showContainerLogs(cur.name);
         screen.render();
       }, 100);
     });
@@ -1133,62 +1856,72 @@ screen.key(["pagedown"], () => {
 screen.key(["C-t"], () => {
   if (state.inFullscreenMode || screen.focused !== ui.containersBox) return;
   const c = state.containers[state.selectedContainerIndex];
-  if (!c || c.state !== "running") {
+  if (!c || !c.running) {
     notify("Container must be running", "red");
     return;
   }
   
-  const cmd = `${dockerCmd} exec -it ${c.name} sh -c "exec /bin/bash || exec /bin/sh"`;
+  const cmd = `${dockerCmd} exec -it ${c.name} sh -c "${SHELL_ENTRY}"`;
   spawnNewWindow(cmd, `exec-${c.name}`);
 });
 
 screen.key(["C-l"], () => {
   if (state.inFullscreenMode || screen.focused !== ui.containersBox) return;
   const c = state.containers[state.selectedContainerIndex];
-  if (!c || c.state !== "running") {
+  if (!c || !c.running) {
     notify("Container must be running", "red");
     return;
   }
   
-  const cmd = `${dockerCmd} logs -f ${c.name}`;
+  const cmd = `${dockerCmd} logs -f --tail ${FULLSCREEN_TAIL_LINES} ${c.name}`;
   spawnNewWindow(cmd, `logs-${c.name}`);
 });
 
-function spawnNewWindow(cmd, label) {
-  const plat = os.platform();
-  
-  if (plat === "win32") {
+// Cached PATH probe
+const probeCache = new Map();
+
+function commandExists(command) {
+  const hit = probeCache.get(command);
+  if (hit && Date.now() - hit.at < PROBE_TTL_MS) return hit.found;
+  const found = execCapture(whichCmd, [command], 5000).then(res => res.code === 0);
+  probeCache.set(command, { at: Date.now(), found });
+  return found;
+}
+
+// Detached launch with the command line passed verbatim
+function launchWindowsTerminal(file, cmdLine, name) {
+  const child = spawn(file, [cmdLine], { detached: true, stdio: "ignore", windowsVerbatimArguments: true });
+  child.on("error", error => notify(`Failed to open ${name}: ${error.message}`, "red"));
+  child.unref();
+}
+
+async function spawnNewWindow(cmd, label) {
+  if (isWindows) {
+    const [hasWt, hasMintty] = await Promise.all([commandExists("wt"), commandExists("mintty")]);
     // Try Windows Terminal first
-    try {
-      execSync("where wt", { stdio: "ignore" });
-      exec(`wt new-tab --title "${label}" cmd /k ${cmd}`, (error) => {
-        if (error) notify(`Failed to open Windows Terminal: ${error.message}`, "red");
-      });
+    if (hasWt) {
+      launchWindowsTerminal("wt", `new-tab --title "${label}" cmd /k ${cmd}`, "Windows Terminal");
       notify(`Opened new tab in Windows Terminal`, "green");
       return;
-    } catch (_) {}
+    }
     
     // Fallback to Git Bash
-    try {
-      execSync("where mintty", { stdio: "ignore" });
+    if (hasMintty) {
       const bashPath = process.env.SHELL || "C:\\Program Files\\Git\\bin\\bash.exe";
-      exec(`mintty -t "${label}" -e ${bashPath} -c "${cmd}"`, (error) => {
-        if (error) notify(`Failed to open Git Bash: ${error.message}`, "red");
-      });
+      launchWindowsTerminal("mintty", `-t "${label}" -e "${bashPath}" -c "${cmd.replace(/"/g, '\\"')}"`, "Git Bash");
       notify(`Opened new Git Bash window`, "green");
       return;
-    } catch (_) {}
+    }
     
-    // Last resort: cmd.exe
-    exec(`start cmd /k ${cmd}`, (error) => {
-      if (error) notify(`Failed to open cmd: ${error.message}`, "red");
-    });
+    // Last resort: cmd.exe, via start so it gets a real console window
+    launchWindowsTerminal("cmd.exe", `/c start "" cmd /k ${cmd}`, "cmd");
     notify(`Opened new cmd window`, "green");
     return;
   }
   
-  if (plat === "darwin") {
-    exec(`osascript -e 'tell application "Terminal" to do script "${cmd}"'`, (error) => {
+  if (platform === "darwin") {
+    const script = cmd.replace(/\\/g, "\\\\").replace(/"/g, '\\"');
+    execFile("osascript", ["-e", `tell application "Terminal" to do script "${script}"`], (error) => {
       if (error) notify(`Failed to open Terminal: ${error.message}`, "red");
     });
     notify(`Opened new Terminal window`, "green");
@@ -1203,24 +1936,21 @@ function spawnNewWindow(cmd, label) {
     `konsole -e ${cmd}`,
   ];
   
-  for (const term of terminals) {
-    try {
-      const [command, ...args] = term.split(" ");
-      execSync(`which ${command}`, { stdio: "ignore" });
-      spawn(command, args, { detached: true, stdio: "ignore" });
-      notify(`Opened new terminal window`, "green");
-      return;
-    } catch (_) {
-      continue;
-    }
+  const candidates = terminals.map(term => term.split(" "));
+  const found = await Promise.all(candidates.map(([command]) => commandExists(command)));
+  for (const [i, [command, ...args]] of candidates.entries()) {
+    if (!found[i]) continue;
+    spawn(command, args, { detached: true, stdio: "ignore" });
+    notify(`Opened new terminal window`, "green");
+    return;
   }
   
   notify("No terminal found. Run manually: " + cmd, "yellow");
 }
 
 // ==================== STARTUP ====================
-process.on("SIGINT", () => { cleanup(); process.exit(0); });
-process.on("SIGTERM", () => { cleanup(); process.exit(0); });
+process.on("SIGINT", quit);
+process.on("SIGTERM", quit);
 process.on("exit", cleanup);
 
 ui.containersBox.focus();
@@ -1230,14 +1960,24 @@ screen.render();
 
 (async () => {
   try {
-    await execPromise(`${dockerCmd} --version`, { timeout: 10000 });
+    const [check] = await Promise.all([checkDocker(), detectEngine()]);
+    if (!check.shell) throw new Error(isWindows ? "WSL is not available" : "sh is not available");
+    if (!check.client) throw new Error("docker CLI not found");
+    if (!check.daemon && !engine.socketPath) notify("Docker daemon is not reachable", "yellow");
     await updateAll();
     
     ui.containersBox.on("select item", async () => {
       state.selectedContainerIndex = ui.containersBox.selected;
       const c = state.containers[state.selectedContainerIndex];
       if (state.currentTab === 0 && c) {
-        showContainerLogs(c.name, "100");
+        switchLogStream(c.name);
+      } else if (state.currentTab >= 2) {
+        // Wait for the cursor to settle
+        if (state.detailTimer) clearTimeout(state.detailTimer);
+        state.detailTimer = setTimeout(() => {
+          state.detailTimer = null;
+          if (!state.inFullscreenMode) updateCurrentTab();
+        }, DETAIL_SWITCH_DELAY_MS);
       } else {
         await updateCurrentTab();
       }
@@ -1262,20 +2002,11 @@ screen.render();
     
     startStatsStream();
     
-    if (state.containers.length > 0) {
-      showContainerLogs(state.containers[0].name, "100");
+    if (state.containers.length > 0 && !state.logTail) {
+      showContainerLogs(state.containers[0].name);
     }
     
-    state.containersInterval = setInterval(async () => {
-      await updateContainers();
-      if (state.currentTab === 1) updateStatsTab();
-      screen.render();
-    }, 3000);
-    
-    state.miscInterval = setInterval(async () => {
-      await Promise.all([updateImages(), updateVolumes(), updateNetworks()]);
-      screen.render();
-    }, 15000);
+    startPolling();
     
   } catch (error) {
     ui.contentBox.setContent(`{red-fg}Docker not accessible: ${error.message}{/red-fg}\n\nMake sure Docker is running.`);